@@ -1,11 +1,22 @@
 import os
+import json
 import logging
 import time
-from typing import Dict, List, Optional
+import functools
+from types import ModuleType
+from urllib.parse import parse_qs, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import orjson
 import pandas as pd
-import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import xxhash
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 
 # Configure logging
@@ -15,30 +26,106 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of event pages requested concurrently per batch
+PAGE_BATCH_SIZE = 5
+
+# Events per page; 100 is the maximum the events API accepts
+EVENTS_PER_PAGE = 100
+
+# Times a rate-limited page is retried after waiting for the limit to reset
+RATE_LIMIT_RETRIES = 3
+
+# Columns of the per-event DataFrame returned by fetch_contributions(detailed=True)
+CONTRIBUTION_COLUMNS = ['date', 'type', 'repo']
+
+# Columns of the daily calendar DataFrame returned by fetch_contributions()
+CALENDAR_COLUMNS = ['date', 'count']
+
+# Reported in place of analysis metrics that calendar data cannot provide
+DETAILED_ONLY_NOTE = 'unavailable for calendar data, requires detailed=True'
+
+GRAPHQL_URL = 'https://api.github.com/graphql'
+
+CONTRIBUTION_CALENDAR_QUERY = """
+query($login: String!, $from: DateTime!, $to: DateTime!) {
+  user(login: $login) {
+    contributionsCollection(from: $from, to: $to) {
+      contributionCalendar {
+        weeks {
+          contributionDays {
+            date
+            contributionCount
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+class Config(NamedTuple):
+    """GitHub credentials read from the environment."""
+    github_token: str
+    username: str
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Config:
+    """
+    Load and validate GitHub credentials from the environment, once per process.
+    
+    Returns:
+        Config: GitHub token and username
+        
+    Raises:
+        ValueError: If any required environment variables are missing.
+    """
+    load_dotenv()
+    required_vars = ['GITHUB_TOKEN', 'GITHUB_USERNAME']
+    values = {var: os.getenv(var) for var in required_vars}
+    missing_vars = [var for var, value in values.items() if not value]
+    if missing_vars:
+        raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
+    return Config(github_token=values['GITHUB_TOKEN'], username=values['GITHUB_USERNAME'])
+
 class GitHubContributionTracker:
+    # matplotlib.pyplot, imported on first use by _pyplot()
+    _plt: Optional[ModuleType] = None
+    # Configured pyplot backend, restored after _pyplot() has switched to Agg
+    _configured_backend: Optional[object] = None
+    _agg_forced: bool = False
+
     def __init__(self) -> None:
         """Initialize the GitHub Contribution Tracker with environment variables and setup."""
-        load_dotenv()
-        self._validate_env_vars()
-        self.github_token = os.getenv('GITHUB_TOKEN')
-        self.username = os.getenv('GITHUB_USERNAME')
+        config = _load_config()
+        self.github_token = config.github_token
+        self.username = config.username
         self.headers = {'Authorization': f'token {self.github_token}'} if self.github_token else {}
         self.data_dir = 'data'
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST'])  # GraphQL queries are read-only
+        )
+        self.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        )
         self.ensure_data_directory()
+        self.etag_cache_path = os.path.join(self.data_dir, 'events_cache.json')
+        self._etag_cache: Dict[str, Dict] = self._load_etag_cache()
 
-    def _validate_env_vars(self) -> None:
-        """
-        Validate required environment variables are set.
-        
-        Raises:
-            ValueError: If any required environment variables are missing.
-        """
-        required_vars = ['GITHUB_TOKEN', 'GITHUB_USERNAME']
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
-        if missing_vars:
-            raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
+    def __enter__(self) -> 'GitHubContributionTracker':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        self.session.close()
 
     def ensure_data_directory(self) -> None:
         """
@@ -55,73 +142,311 @@ class GitHubContributionTracker:
             logger.error(f"Failed to create data directory: {str(e)}")
             raise
 
-    def fetch_contributions(self, days: int = 365) -> pd.DataFrame:
+    def _load_etag_cache(self) -> Dict[str, Dict]:
+        """
+        Load cached event pages and their ETags from disk.
+        
+        Returns:
+            Dict[str, Dict]: Cached pages keyed by "username:page", each holding
+                             the page's etag, body hash, events and last page number.
+                             Empty if no usable cache exists.
+        """
+        if not os.path.exists(self.etag_cache_path):
+            return {}
+        try:
+            with open(self.etag_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable events cache: {str(e)}")
+            return {}
+
+    def _save_etag_cache(self) -> None:
         """
-        Fetch contribution data from GitHub with pagination support.
+        Atomically persist the event page cache to disk.
+        
+        Raises:
+            OSError: If writing the cache fails
+        """
+        tmp_path = f'{self.etag_cache_path}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._etag_cache, f)
+            os.replace(tmp_path, self.etag_cache_path)
+        except OSError as e:
+            logger.error(f"Failed to save events cache: {str(e)}")
+            raise
+
+    def fetch_contributions(self, days: int = 365, detailed: bool = False) -> pd.DataFrame:
+        """
+        Fetch contribution data from GitHub.
+        
+        By default a single GraphQL query fetches the daily totals of the user's
+        contribution calendar. Per-event detail (type and repository) requires
+        paging through the REST events API instead.
         
         Args:
             days (int): Number of days of history to fetch (default: 365)
+            detailed (bool): Fetch individual events instead of daily totals (default: False)
             
         Returns:
             pd.DataFrame: DataFrame containing contribution data with columns:
                          - date: Date of contribution
-                         - type: Type of contribution event
-                         - repo: Repository name
+                         - count: Number of contributions on that date (calendar data)
+                         - type: Type of contribution event (detailed data)
+                         - repo: Repository name (detailed data)
             
         Raises:
-            ValueError: If days is not a positive integer
+            ValueError: If days is not a positive integer, or exceeds 365 for calendar data
             requests.RequestException: If API request fails
         """
         if not isinstance(days, int) or days <= 0:
             raise ValueError("Days must be a positive integer")
 
-        end_date = datetime.now()
+        if detailed:
+            return self._fetch_events(days)
+        return self._fetch_graphql(days)
+
+    def _fetch_graphql(self, days: int) -> pd.DataFrame:
+        """
+        Fetch daily contribution totals with one GraphQL contribution calendar query.
+        
+        Args:
+            days (int): Number of days of history to fetch
+            
+        Returns:
+            pd.DataFrame: DataFrame with date and count columns, one row per day
+            
+        Raises:
+            ValueError: If days exceeds the one-year span GitHub allows
+            requests.RequestException: If API request fails
+        """
+        if days > 365:
+            raise ValueError("Contribution calendar spans at most 365 days; use detailed=True")
+
+        end_date = datetime.now(timezone.utc).replace(microsecond=0)
         start_date = end_date - timedelta(days=days)
+        variables = {
+            'login': self.username,
+            'from': start_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'to': end_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+        }
+
+        try:
+            response = self.session.post(
+                GRAPHQL_URL,
+                json={'query': CONTRIBUTION_CALENDAR_QUERY, 'variables': variables},
+                timeout=10
+            )
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get('errors'):
+                messages = '; '.join(error.get('message', '') for error in payload['errors'])
+                raise requests.RequestException(f"GraphQL query failed: {messages}")
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch data: {str(e)}")
+            raise
+
+        weeks = payload['data']['user']['contributionsCollection']['contributionCalendar']['weeks']
+        df = pd.json_normalize(weeks, record_path='contributionDays')
+        if df.empty:
+            return pd.DataFrame(columns=CALENDAR_COLUMNS)
+        df = df.rename(columns={'contributionCount': 'count'})
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d').dt.date
+        return df[CALENDAR_COLUMNS]
+
+    def _fetch_events(self, days: int) -> pd.DataFrame:
+        """
+        Fetch individual contribution events, requesting event pages concurrently in batches.
+        
+        Args:
+            days (int): Number of days of history to fetch
+            
+        Returns:
+            pd.DataFrame: DataFrame with date, type and repo columns, one row per event
+            
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        end_date = datetime.now(timezone.utc).replace(microsecond=0)
+        start_date = end_date - timedelta(days=days)
+        # ISO-8601 timestamps sort lexicographically, so the window can be
+        # checked on the raw strings without parsing every event
+        start_iso = start_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+        end_iso = end_date.strftime('%Y-%m-%dT%H:%M:%SZ')
         
         url = f'https://api.github.com/users/{self.username}/events'
-        contributions = []
-        page = 1
+        records = []
+        # Only page 1 is requested until its Link header reports the last page
+        page, last_page = 1, 1
 
-        while True:
-            try:
-                response = self.session.get(
-                    f"{url}?page={page}",
-                    timeout=10
-                )
-                response.raise_for_status()
-                
-                # Check rate limits
-                remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-                if remaining == 0:
-                    reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                    wait_time = reset_time - datetime.now().timestamp()
-                    if wait_time > 0:
-                        logger.warning(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
-                        time.sleep(wait_time + 1)  # Add 1 second buffer
-                        continue
-
-                events = response.json()
-                if not events:  # No more events
-                    break
-
-                for event in events:
-                    event_date = datetime.strptime(event['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-                    if event_date < start_date:
-                        return pd.DataFrame(contributions)
-                    if event_date <= end_date:
-                        contributions.append({
-                            'date': event_date.date(),
-                            'type': event['type'],
-                            'repo': event['repo']['name']
-                        })
-
-                page += 1
-                
-            except requests.RequestException as e:
-                logger.error(f"Failed to fetch data: {str(e)}")
-                raise
+        try:
+            with ThreadPoolExecutor(max_workers=PAGE_BATCH_SIZE) as executor:
+                while page <= last_page:
+                    pages = range(page, min(page + PAGE_BATCH_SIZE, last_page + 1))
+                    try:
+                        results = list(executor.map(lambda p: self._fetch_page(url, p), pages))
+                    except requests.RequestException as e:
+                        logger.error(f"Failed to fetch data: {str(e)}")
+                        raise
 
-        return pd.DataFrame(contributions)
+                    for _, events, page_count in results:
+                        last_page = max(last_page, page_count)
+                        # Events are newest first: once a page's newest event predates
+                        # the window, neither it nor any later page has events to keep
+                        if events and events[0]['created_at'] < start_iso:
+                            return self._records_to_frame(records, start_iso, end_iso)
+
+                        records.extend(
+                            (event['created_at'], event['type'], event['repo']['name'])
+                            for event in events
+                        )
+                        if events and events[-1]['created_at'] < start_iso:
+                            return self._records_to_frame(records, start_iso, end_iso)
+
+                    # Check rate limits before requesting the next batch
+                    responses = [response for response, _, _ in results]
+                    remaining = min(int(r.headers.get('X-RateLimit-Remaining', 0)) for r in responses)
+                    if remaining == 0 and pages[-1] < last_page:
+                        self._wait_for_rate_limit(responses[-1])
+
+                    page = pages[-1] + 1
+        finally:
+            self._save_etag_cache()
+
+        return self._records_to_frame(records, start_iso, end_iso)
+
+    @staticmethod
+    def _records_to_frame(records: List[Tuple[str, str, str]], start_iso: str, end_iso: str) -> pd.DataFrame:
+        """
+        Build the contribution DataFrame from raw event records in one pass.
+        
+        Args:
+            records (List[Tuple[str, str, str]]): (created_at, type, repo) tuples
+            start_iso (str): Earliest timestamp to keep, as an ISO-8601 string
+            end_iso (str): Latest timestamp to keep, as an ISO-8601 string
+            
+        Returns:
+            pd.DataFrame: Contribution data with categorical type and repo columns
+        """
+        created, types, repos = zip(*records) if records else ((), (), ())
+        # Fixed-width byte strings keep the window check a native NumPy comparison;
+        # the first 10 bytes of each timestamp are its date
+        created = np.asarray(created, dtype='S20')
+        mask = (created >= start_iso.encode()) & (created <= end_iso.encode())
+        return pd.DataFrame({
+            'date': created[mask].astype('S10').astype('datetime64[D]').astype(object),
+            'type': pd.Categorical(np.asarray(types, dtype=object)[mask]),
+            'repo': pd.Categorical(np.asarray(repos, dtype=object)[mask])
+        }, columns=CONTRIBUTION_COLUMNS)
+
+    def _fetch_page(self, url: str, page: int) -> Tuple[requests.Response, List[Dict], int]:
+        """
+        Fetch a single page of events, waiting out the rate limit if it is exhausted.
+        
+        Pages seen before are requested conditionally with their cached ETag; a
+        304 Not Modified response reuses the cached events and does not count
+        against the rate limit. A 200 response whose body hashes the same as
+        the cached page also reuses the cached events without parsing.
+        
+        Args:
+            url (str): Events endpoint URL
+            page (int): Page number to fetch
+            
+        Returns:
+            Tuple[requests.Response, List[Dict], int]: Response for the requested page,
+                                                       the events it contains and the
+                                                       number of the last available page
+            
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        cache_key = f'{self.username}:{page}'
+        cached = self._etag_cache.get(cache_key)
+        revalidate = cached and cached.get('etag') and 'last_page' in cached
+        headers = {'If-None-Match': cached['etag']} if revalidate else {}
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = self.session.get(
+                url,
+                params={'per_page': EVENTS_PER_PAGE, 'page': page},
+                headers=headers,
+                timeout=10
+            )
+            rate_limited = (
+                response.status_code in (403, 429)
+                and response.headers.get('X-RateLimit-Remaining') == '0'
+            )
+            # Retry only after actually waiting; a missing or past reset time
+            # falls through to raise_for_status instead of resending at once
+            if rate_limited and attempt < RATE_LIMIT_RETRIES and self._wait_for_rate_limit(response):
+                continue
+            break
+
+        if response.status_code == 304:
+            return response, cached['events'], cached['last_page']
+        response.raise_for_status()
+
+        # A body identical to the cached page (e.g. when a proxy drops the ETag)
+        # reuses the cached events instead of being parsed again
+        digest = xxhash.xxh3_64(response.content).hexdigest()
+        if cached and cached.get('xxh') == digest:
+            events = cached['events']
+        else:
+            # Keep only the fields read back, so cached pages stay small
+            events = [
+                {
+                    'created_at': event['created_at'],
+                    'type': event['type'],
+                    'repo': {'name': event['repo']['name']}
+                }
+                for event in response.json()
+            ]
+        last_page = self._last_page(response, page)
+        self._etag_cache[cache_key] = {
+            'etag': response.headers.get('ETag'),
+            'xxh': digest,
+            'events': events,
+            'last_page': last_page
+        }
+        return response, events, last_page
+
+    @staticmethod
+    def _last_page(response: requests.Response, page: int) -> int:
+        """
+        Read the number of the last available page from a response's Link header.
+        
+        Args:
+            response (requests.Response): Response for an events page
+            page (int): Page number the response belongs to
+            
+        Returns:
+            int: Last page number, or the current page if no further pages exist
+        """
+        links = response.links
+        if 'last' in links:
+            query = parse_qs(urlparse(links['last']['url']).query)
+            return int(query['page'][0])
+        if 'next' in links:
+            return page + 1
+        return page
+
+    def _wait_for_rate_limit(self, response: requests.Response) -> bool:
+        """
+        Sleep until the rate limit window reported by a response resets.
+        
+        Args:
+            response (requests.Response): Response carrying the rate limit headers
+            
+        Returns:
+            bool: True if it slept, False if no future reset time was reported
+        """
+        reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+        wait_time = reset_time - datetime.now().timestamp()
+        if wait_time <= 0:
+            return False
+        logger.warning(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
+        time.sleep(wait_time + 1)  # Add 1 second buffer
+        return True
 
     def analyze_contributions(self, df: pd.DataFrame) -> Dict[str, any]:
         """
@@ -136,7 +461,21 @@ class GitHubContributionTracker:
                            - contribution_types: Dictionary of contribution types and counts
                            - active_repositories: Number of unique repositories
                            - daily_average: Average contributions per day
+                           Calendar data only carries daily totals, so its
+                           contribution_types and active_repositories are None.
         """
+        if 'count' in df.columns:
+            active_days = df[df['count'] > 0]
+            total = int(active_days['count'].sum())
+            if active_days.empty:
+                logger.warning("No contributions found in the specified time period")
+            return {
+                'total_contributions': total,
+                'contribution_types': None,
+                'active_repositories': None,
+                'daily_average': total / len(active_days) if total else 0
+            }
+
         if df.empty:
             logger.warning("No contributions found in the specified time period")
             return {
@@ -146,11 +485,17 @@ class GitHubContributionTracker:
                 'daily_average': 0
             }
 
+        # One grouped pass over categorical codes yields every metric below;
+        # observed=True keeps unused categories out of the result
+        df = df.assign(type=df['type'].astype('category'), repo=df['repo'].astype('category'))
+        counts = df.groupby(['type', 'repo', 'date'], observed=True, sort=False).size()
+        total = int(counts.sum())
+        type_counts = counts.groupby(level='type', observed=True).sum()
         analysis = {
-            'total_contributions': len(df),
-            'contribution_types': df['type'].value_counts().to_dict(),
-            'active_repositories': df['repo'].nunique(),
-            'daily_average': len(df) / df['date'].nunique()
+            'total_contributions': total,
+            'contribution_types': type_counts.sort_values(ascending=False).to_dict(),
+            'active_repositories': counts.index.get_level_values('repo').nunique(),
+            'daily_average': total / counts.index.get_level_values('date').nunique()
         }
         return analysis
 
@@ -175,9 +520,16 @@ class GitHubContributionTracker:
             logger.warning("No data to visualize")
             return
 
+        plt = self._pyplot(headless=save_path is not None)
         plt.figure(figsize=figsize)
         
-        daily_counts = df.groupby('date').size()
+        # One bar per calendar day, including days without contributions
+        all_dates = pd.date_range(df['date'].min(), df['date'].max(), freq='D').date
+        if 'count' in df.columns:
+            daily_counts = df.set_index('date')['count']
+        else:
+            daily_counts = df['date'].value_counts(sort=False)
+        daily_counts = daily_counts.reindex(all_dates, fill_value=0)
         daily_counts.plot(kind='bar', alpha=0.7)
         
         plt.title('GitHub Contributions Over Time')
@@ -197,6 +549,34 @@ class GitHubContributionTracker:
             plt.show()
         plt.close()
 
+    @classmethod
+    def _pyplot(cls, headless: bool) -> ModuleType:
+        """
+        Import matplotlib.pyplot on first use, keeping it out of startup time.
+        
+        Args:
+            headless (bool): Use the non-interactive Agg backend for this figure,
+                             which is only saved to disk; otherwise the configured
+                             backend is restored if an earlier call switched away
+            
+        Returns:
+            ModuleType: The matplotlib.pyplot module
+        """
+        if cls._plt is None:
+            import matplotlib
+            # A copy of rcParams returns the backend as configured (MPLBACKEND,
+            # matplotlibrc or the auto-detect marker) without resolving it
+            cls._configured_backend = matplotlib.rcParams.copy()['backend']
+            import matplotlib.pyplot as plt
+            cls._plt = plt
+        if headless and not cls._agg_forced:
+            cls._plt.switch_backend('Agg')
+            cls._agg_forced = True
+        elif not headless and cls._agg_forced:
+            cls._plt.switch_backend(cls._configured_backend)
+            cls._agg_forced = False
+        return cls._plt
+
     def save_data(self, df: pd.DataFrame, analysis: Dict[str, any]) -> None:
         """
         Save contribution data and analysis.
@@ -213,19 +593,44 @@ class GitHubContributionTracker:
         try:
             # Save raw data
             data_path = os.path.join(self.data_dir, f'contributions_{timestamp}.csv')
-            df.to_csv(data_path, index=False)
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), data_path)
             logger.info(f"Saved contribution data to {data_path}")
             
             # Save analysis
-            analysis_path = os.path.join(self.data_dir, f'analysis_{timestamp}.txt')
-            with open(analysis_path, 'w') as f:
-                for key, value in analysis.items():
-                    f.write(f'{key}: {value}\n')
+            analysis_path = os.path.join(self.data_dir, f'analysis_{timestamp}.json')
+            unavailable = {key: DETAILED_ONLY_NOTE for key, value in analysis.items() if value is None}
+            if unavailable:
+                analysis = {**analysis, 'unavailable_metrics': unavailable}
+            blob = orjson.dumps(
+                analysis,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+            self._write_bytes(analysis_path, blob)
             logger.info(f"Saved analysis to {analysis_path}")
         except OSError as e:
             logger.error(f"Failed to save data: {str(e)}")
             raise
 
+    @staticmethod
+    def _write_bytes(path: str, blob: bytes) -> None:
+        """
+        Write a bytes blob to a file with raw os.write calls, bypassing Python's io stack.
+        
+        Args:
+            path (str): Destination file path, created or truncated
+            blob (bytes): Content to write
+            
+        Raises:
+            OSError: If writing the file fails
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
 def main() -> None:
     """
     Main function to run the GitHub contribution tracking process.
@@ -234,32 +639,29 @@ def main() -> None:
     Raises:
         Exception: If any step of the process fails
     """
-    tracker = GitHubContributionTracker()
-    
-    try:
-        logger.info("Fetching GitHub contributions...")
-        contributions_df = tracker.fetch_contributions()
-        
-        logger.info("Analyzing contribution data...")
-        analysis_results = tracker.analyze_contributions(contributions_df)
-        
-        logger.info("Creating visualization...")
-        viz_path = os.path.join(tracker.data_dir, 'contribution_graph.png')
-        tracker.visualize_contributions(contributions_df, save_path=viz_path)
-        
-        logger.info("Saving results...")
-        tracker.save_data(contributions_df, analysis_results)
-        
-        logger.info("Contribution analysis completed successfully!")
-        print("\nSummary:")
-        for key, value in analysis_results.items():
-            print(f"{key}: {value}")
+    with GitHubContributionTracker() as tracker:
+        try:
+            logger.info("Fetching GitHub contributions...")
+            contributions_df = tracker.fetch_contributions()
+            
+            logger.info("Analyzing contribution data...")
+            analysis_results = tracker.analyze_contributions(contributions_df)
             
-    except Exception as e:
-        logger.error(f"Error in main execution: {str(e)}")
-        raise
-    finally:
-        tracker.session.close()
+            logger.info("Creating visualization...")
+            viz_path = os.path.join(tracker.data_dir, 'contribution_graph.png')
+            tracker.visualize_contributions(contributions_df, save_path=viz_path)
+            
+            logger.info("Saving results...")
+            tracker.save_data(contributions_df, analysis_results)
+            
+            logger.info("Contribution analysis completed successfully!")
+            print("\nSummary:")
+            for key, value in analysis_results.items():
+                print(f"{key}: {DETAILED_ONLY_NOTE if value is None else value}")
+                
+        except Exception as e:
+            logger.error(f"Error in main execution: {str(e)}")
+            raise
 
 if __name__ == "__main__":
     main()